@@ -10,6 +10,10 @@ logger = DefaultLoggerFactory.get_logger(__name__)
 class DiscordEmbed:
     FAKE_DATA_URL = "https://tonies.local"
 
+    def __init__(self):
+        """Initialize DiscordEmbed"""
+        self._embed_cache: dict[str, tuple[discord.Embed, str]] = {}
+
     @staticmethod
     def create_hidden_data_url(tonie_data: dict) -> str:
         """Create a URL with base64 encoded tonie data"""
@@ -29,9 +33,14 @@ class DiscordEmbed:
             logger.error(f"Error encoding tonie data: {e}")
             return None
 
+    def clear_cache(self) -> None:
+        """Invalidate all cached embeds"""
+        logger.debug(f"Clearing {len(self._embed_cache)} cached embeds")
+        self._embed_cache.clear()
+
     @staticmethod
-    def create_tonie_embed(tonie_data: dict, attachment: discord.Attachment) -> discord.Embed:
-        """Create a Discord embed message from tonie data"""
+    def create_static_embed(tonie_data: dict) -> tuple[discord.Embed, str]:
+        """Create the rUID independent part of the embed and its footer text"""
         embed = discord.Embed(
             color=0xd2000e,
             title=tonie_data.get("episode", None),
@@ -39,10 +48,6 @@ class DiscordEmbed:
             url=tonie_data.get("web", None),
         )
 
-        embed.set_author(name=attachment.filename, url=attachment.url)
-
-        hidden_data_url = DiscordEmbed.create_hidden_data_url(tonie_data)
-
         if "age" in tonie_data and tonie_data["age"] is not None:
             embed.add_field(name="Age", value=f"{tonie_data['age']} years", inline=True)
 
@@ -79,15 +84,34 @@ class DiscordEmbed:
         if "image" in tonie_data and tonie_data["image"] is not None:
             embed.set_thumbnail(url=tonie_data["image"])
 
+        footer_text = "Released: unknown"
         if "release" in tonie_data and tonie_data["release"] is not None:
             try:
                 release_date = datetime.fromtimestamp(int(tonie_data["release"]), tz=timezone.utc)
                 formatted_date = release_date.strftime("%Y-%m-%d")
-                embed.set_footer(text=f"Released: {formatted_date}", icon_url=hidden_data_url)
+                footer_text = f"Released: {formatted_date}"
             except (ValueError, TypeError) as e:
                 logger.error(f"Error converting timestamp: {e}")
-                embed.set_footer(text="Released: unknown", icon_url=hidden_data_url)
-        else:
-            embed.set_footer(text="Released: unknown", icon_url=hidden_data_url)
 
-        return embed
\ No newline at end of file
+        return embed, footer_text
+
+    def create_tonie_embed(self, tonie_data: dict, attachment: discord.Attachment) -> discord.Embed:
+        """Create a Discord embed message from tonie data"""
+        audio_id = tonie_data.get("audio_id")
+        cached = self._embed_cache.get(audio_id)
+        if cached is None:
+            logger.debug(f"Building embed for audio_id: {audio_id}")
+            cached = DiscordEmbed.create_static_embed(tonie_data)
+            # Only tonies found in the JSON data carry the episode key
+            if audio_id and "episode" in tonie_data:
+                self._embed_cache[audio_id] = cached
+
+        static_embed, footer_text = cached
+        embed = static_embed.copy()
+
+        embed.set_author(name=attachment.filename, url=attachment.url)
+
+        hidden_data_url = DiscordEmbed.create_hidden_data_url(tonie_data)
+        embed.set_footer(text=footer_text, icon_url=hidden_data_url)
+
+        return embed
@@ -1,5 +1,6 @@
 import base64
 import json
+import os
 import urllib.parse
 import discord
 import asyncio
@@ -10,7 +11,9 @@ logger = DefaultLoggerFactory.get_logger(__name__)
 class DiscordReply:
     CMD_PREFIX = "!"
     FAKE_DATA_URL = "https://tonies.local"
+    MAX_PROFILE_DURATION = 60.0
     on_add_callback = None
+    on_profile_callback = None
 
     @staticmethod
     def on_add(func):
@@ -21,6 +24,15 @@ class DiscordReply:
         else:
             return None
 
+    @staticmethod
+    def on_profile(func):
+        """Decorator to register an external profile callback."""
+        if asyncio.iscoroutinefunction(func):
+            DiscordReply.on_profile_callback = func
+            return func
+        else:
+            return None
+
     @staticmethod
     def parse_hidden_data_url(url: str) -> dict:
         """Parse base64 encoded JSON data from URL"""
@@ -76,6 +88,28 @@ class DiscordReply:
             logger.warning("No add callback registered")
             await message.reply("❌ Add functionality not available")
 
+    @staticmethod
+    async def handle_profile_command(message: discord.Message, args: list[str]) -> None:
+        """Handle the profile command"""
+        if f"{message.author}" != os.getenv('DISCORD_AUTHOR'):
+            logger.warning(f"Ignoring profile command from {message.author}")
+            return
+
+        if DiscordReply.on_profile_callback is None:
+            logger.warning("No profile callback registered")
+            await message.reply("❌ Profile functionality not available")
+            return
+
+        try:
+            duration = float(args[0]) if args else 10.0
+        except ValueError:
+            await message.reply("❌ Invalid duration")
+            return
+
+        duration = max(1.0, min(duration, DiscordReply.MAX_PROFILE_DURATION))
+        await message.reply(f"⏱️ Profiling event loop for {duration:g} seconds")
+        await DiscordReply.on_profile_callback(message, duration)
+
     @staticmethod
     async def get_referenced_message(message: discord.Message, client: discord.Client) -> discord.Message | None:
         """Get the referenced message if it exists and is from the bot"""
@@ -95,6 +129,12 @@ class DiscordReply:
         if not message.content.startswith(DiscordReply.CMD_PREFIX):
             return False
 
+        # Profile command is not bound to a bot message
+        args = message.content[len(DiscordReply.CMD_PREFIX):].lower().split()
+        if args and args[0] == "profile":
+            await DiscordReply.handle_profile_command(message, args[1:])
+            return True
+
         referenced = await DiscordReply.get_referenced_message(message, client)
         if not referenced:
             return False
@@ -0,0 +1,100 @@
+import io
+import os
+import time
+import asyncio
+import urllib.parse
+from collections import OrderedDict
+import discord
+import httpx
+from logger_factory import DefaultLoggerFactory
+
+logger = DefaultLoggerFactory.get_logger(__name__)
+
+class ImageCache:
+    WAIT_TIMEOUT = 1.0
+    RETRY_INTERVAL = 5 * 60
+
+    def __init__(self):
+        """Initialize ImageCache"""
+        self.enabled = os.getenv("DISCORD_ATTACH_IMAGES", "false").lower() == "true"
+        try:
+            self.max_size = int(os.getenv("IMAGE_CACHE_SIZE", "100"))
+        except ValueError:
+            logger.error("Invalid IMAGE_CACHE_SIZE, using 100")
+            self.max_size = 100
+        if self.max_size <= 0:
+            logger.warning("IMAGE_CACHE_SIZE is not positive, disabling image attachments")
+            self.enabled = False
+        self._images = OrderedDict()
+        self._pending = {}
+        self._failures = {}
+        logger.debug(f"ImageCache initialized, enabled: {self.enabled}, max_size: {self.max_size}")
+
+    def clear(self) -> None:
+        """Invalidate all cached images and cancel running fetches"""
+        logger.debug(f"Clearing {len(self._images)} cached images, cancelling {len(self._pending)} fetches")
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._images.clear()
+        self._failures.clear()
+
+    def prefetch(self, url: str | None) -> None:
+        """Start fetching an image in the background if it is not cached yet"""
+        if not self.enabled or not url or url in self._images or url in self._pending:
+            return
+
+        # Do not retry a failed fetch before the retry interval passed
+        failed_at = self._failures.get(url)
+        if failed_at is not None and time.monotonic() - failed_at < self.RETRY_INTERVAL:
+            return
+
+        self._pending[url] = asyncio.create_task(self._fetch(url))
+
+    async def _fetch(self, url: str) -> None:
+        content = None
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                logger.debug(f"Fetching image from {url}")
+                response = await client.get(url)
+                response.raise_for_status()
+                content = response.content
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch image: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error while fetching image: {str(e)}")
+        finally:
+            # A newer fetch may have replaced this one after clear()
+            if self._pending.get(url) is asyncio.current_task():
+                del self._pending[url]
+
+        if content is None:
+            self._failures[url] = time.monotonic()
+            return
+
+        self._failures.pop(url, None)
+        self._images[url] = content
+        while len(self._images) > self.max_size:
+            self._images.popitem(last=False)
+
+    async def get_file(self, url: str | None, name: str) -> discord.File | None:
+        """Get an image as a Discord file, waiting briefly for it to be fetched if not cached yet"""
+        if not self.enabled or not url:
+            return None
+
+        if url not in self._images:
+            self.prefetch(url)
+            pending = self._pending.get(url)
+            if pending is None:
+                return None
+
+            # Give up after a short wait, the fetch continues for later scans
+            await asyncio.wait({pending}, timeout=self.WAIT_TIMEOUT)
+            if url not in self._images:
+                return None
+
+        self._images.move_to_end(url)
+        content = self._images[url]
+
+        extension = os.path.splitext(urllib.parse.urlparse(url).path)[1] or ".png"
+        return discord.File(io.BytesIO(content), filename=f"{name}{extension}")
@@ -0,0 +1,136 @@
+import io
+import os
+import sys
+import time
+import asyncio
+import threading
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+from logger_factory import DefaultLoggerFactory
+
+logger = DefaultLoggerFactory.get_logger(__name__)
+
+class LoopMonitor:
+    def __init__(self):
+        """Initialize LoopMonitor"""
+        try:
+            self.threshold = float(os.getenv("LOOP_LAG_THRESHOLD", "0.5"))
+        except ValueError:
+            logger.error("Invalid LOOP_LAG_THRESHOLD, using 0.5 seconds")
+            self.threshold = 0.5
+
+        self.interval = min(self.threshold / 4, 0.1) if self.threshold > 0 else 0.1
+        self.stalls = deque(maxlen=50)
+        self._loop = None
+        self._loop_thread_id = None
+        self._last_beat = time.monotonic()
+        self._heartbeat_task = None
+        self._watchdog_thread = None
+        self._profile_lock = asyncio.Lock()
+        logger.debug(f"LoopMonitor initialized with threshold: {self.threshold}s")
+
+    def start(self):
+        """Start the heartbeat and watchdog, must be called from the running event loop"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+
+        if self.threshold <= 0:
+            logger.info("Loop lag monitor disabled")
+            return
+
+        if self._watchdog_thread and self._watchdog_thread.is_alive():
+            return
+
+        logger.info(f"Starting loop lag monitor with threshold: {self.threshold}s")
+        self._last_beat = time.monotonic()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog_thread = threading.Thread(target=self._watchdog, name="loop-watchdog", daemon=True)
+        self._watchdog_thread.start()
+
+    async def _heartbeat(self):
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+    def _current_task_name(self) -> str:
+        """Get the name of the task currently running on the event loop"""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        return task.get_name() if task else "<no task>"
+
+    def _loop_frame(self):
+        """Get the frame the event loop thread is currently executing"""
+        return sys._current_frames().get(self._loop_thread_id)
+
+    def _watchdog(self):
+        stall = None
+        stall_beat = None
+        while True:
+            time.sleep(self.interval)
+            last_beat = self._last_beat
+
+            # Loop resumed, record the real duration of the stall
+            if stall is not None and last_beat != stall_beat:
+                stall["lag"] = last_beat - stall_beat - self.interval
+                logger.warning(f"Event loop resumed after being blocked for {stall['lag']:.3f}s in task {stall['task']}")
+                stall = None
+
+            lag = time.monotonic() - last_beat - self.interval
+            if stall is not None or lag < self.threshold:
+                continue
+
+            # Capture the stack while the loop is still blocked
+            task_name = self._current_task_name()
+            frame = self._loop_frame()
+            stack = "".join(traceback.format_stack(frame)) if frame else "<no stack>"
+            stall = {
+                "time": time.time(),
+                "lag": lag,
+                "task": task_name,
+                "stack": stack
+            }
+            stall_beat = last_beat
+            self.stalls.append(stall)
+            logger.warning(f"Event loop blocked for over {lag:.3f}s in task {task_name}:\n{stack}")
+
+    async def profile(self, duration: float, interval: float = 0.005) -> io.BytesIO:
+        """Sample the event loop thread for the given duration and return collapsed stacks"""
+        if self._loop is None:
+            self.start()
+
+        async with self._profile_lock:
+            logger.info(f"Profiling event loop for {duration}s")
+            samples = await asyncio.to_thread(self._sample, duration, interval)
+            logger.info(f"Profiling finished with {sum(samples.values())} samples")
+
+        lines = [f"{stack} {count}" for stack, count in samples.most_common()]
+        return io.BytesIO("\n".join(lines).encode())
+
+    def format_stalls(self) -> io.BytesIO:
+        """Format the recorded stalls as a text report"""
+        entries = []
+        for stall in self.stalls:
+            timestamp = datetime.fromtimestamp(stall["time"]).strftime("%Y-%m-%d %H:%M:%S")
+            entries.append(f"{timestamp} blocked for {stall['lag']:.3f}s in task {stall['task']}\n{stall['stack']}")
+        return io.BytesIO("\n".join(entries).encode())
+
+    def _sample(self, duration: float, interval: float) -> Counter:
+        samples = Counter()
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            # Read task and frame together so the label matches the stack
+            task_name = self._current_task_name()
+            frame = self._loop_frame()
+            if frame is not None:
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                frames.reverse()
+                samples[";".join([task_name] + frames)] += 1
+            time.sleep(interval)
+        return samples
@@ -8,6 +8,8 @@ from discord_embed import DiscordEmbed
 from logger_factory import DefaultLoggerFactory
 from discord_reply import DiscordReply
 from teddycloud_api import TeddyCloudApi
+from loop_monitor import LoopMonitor
+from image_cache import ImageCache
 
 logger = DefaultLoggerFactory.get_logger(__name__)
 
@@ -16,6 +18,9 @@ load_dotenv()
 tonies_api = ToniesApi()
 tonies_json = ToniesJson()
 teddycloud_api = TeddyCloudApi()
+loop_monitor = LoopMonitor()
+image_cache = ImageCache()
+discord_embed = DiscordEmbed()
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -26,6 +31,13 @@ client = discord.Client(intents=intents)
 async def on_ready():
     logger.info(f'Discord bot logged in as {client.user}')
     tonies_json.start_updates()
+    loop_monitor.start()
+
+@tonies_json.on_update
+def on_catalogue_update():
+    """Invalidate caches derived from the JSON data"""
+    discord_embed.clear_cache()
+    image_cache.clear()
 
 @client.event
 async def on_message(message):
@@ -66,8 +78,11 @@ async def on_message(message):
         if tonie:
             tonie["ruid"] = nfc.ruid
             tonie["auth"] = nfc.auth
-            embed = DiscordEmbed.create_tonie_embed(tonie, attachment)
-            await message.channel.send(embed=embed)
+            embed = discord_embed.create_tonie_embed(tonie, attachment)
+            image_file = await image_cache.get_file(tonie.get("image"), tonie["audio_id"])
+            if image_file:
+                embed.set_thumbnail(url=f"attachment://{image_file.filename}")
+            await message.channel.send(embed=embed, file=image_file)
             logger.info("Sent embed message to Discord channel")
 
             # Delete the origin message if DISCORD_DELETE_ORIGIN_MESSAGE is true
@@ -76,7 +91,7 @@ async def on_message(message):
                 logger.debug("Deleted origin message")
         else:
             tonie = {"ruid": nfc.ruid, "auth": nfc.auth, "audio_id": result["audio_id"], "hash": result["hash"]}
-            embed = DiscordEmbed.create_tonie_embed(tonie, attachment)
+            embed = discord_embed.create_tonie_embed(tonie, attachment)
             await message.channel.send(embed=embed)
             logger.info("Sent embed message to Discord channel")
 
@@ -118,4 +133,20 @@ async def on_add(tonie_data: dict) -> dict:
         logger.error(error)
         return {"success": False, "error": error}
 
+@DiscordReply.on_profile
+async def on_profile(message: discord.Message, duration: float) -> None:
+    """Handle profiling the event loop and uploading the collapsed stacks"""
+    try:
+        result = await loop_monitor.profile(duration)
+        await message.reply(
+            f"✅ Profile finished, {len(loop_monitor.stalls)} stalls recorded",
+            files=[
+                discord.File(result, filename="profile.collapsed.txt"),
+                discord.File(loop_monitor.format_stalls(), filename="stalls.txt")
+            ]
+        )
+    except Exception as e:
+        logger.error(f"Error profiling event loop: {str(e)}")
+        await message.reply(f"❌ Failed to profile event loop: {str(e)}")
+
 client.run(os.getenv('DISCORD_TOKEN'))
\ No newline at end of file
@@ -13,25 +13,40 @@ class ToniesJson:
             logger.error("JSON_URL environment variable not set")
         self.json_data = None
         self._update_task = None
+        self._update_callbacks = []
         logger.debug(f"ToniesJson initialized with URL: {self.json_url}")
 
     async def fetch_json(self):
         while True:
             logger.debug("Starting JSON fetch cycle")
+            updated = False
             async with httpx.AsyncClient() as client:
                 try:
                     logger.debug(f"Fetching JSON from {self.json_url}")
                     response = await client.get(self.json_url)
                     response.raise_for_status()
                     self.json_data = response.json()
+                    updated = True
                     logger.info(f"JSON data updated successfully at {datetime.now()}, entries: {len(self.json_data)}")
                 except httpx.HTTPError as e:
                     logger.error(f"Failed to fetch JSON: {e}")
                 except Exception as e:
                     logger.error(f"Unexpected error while fetching JSON: {str(e)}")
+
+            if updated:
+                for callback in self._update_callbacks:
+                    try:
+                        callback()
+                    except Exception as e:
+                        logger.error(f"Error in JSON update callback {callback.__name__}: {str(e)}")
             logger.debug("Sleeping for 24 hours before next update")
             await asyncio.sleep(24 * 60 * 60)  # 24 hours in seconds
 
+    def on_update(self, func):
+        """Decorator to register a callback invoked after the JSON data was refreshed."""
+        self._update_callbacks.append(func)
+        return func
+
     def start_updates(self):
         logger.info("Starting periodic JSON updates")
         self._update_task = asyncio.create_task(self.fetch_json())